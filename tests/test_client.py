@@ -0,0 +1,333 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import httpx
+import orjson
+import pytest
+from ulroy import AsyncUlroyClient, UlroyClient, TaskStatus
+from ulroy.exceptions import APIError
+from ulroy.helpers import (
+    legacy,
+    poll_task_status_async,
+    poll_task_status_stream_async,
+    poll_task_status_stream_sync,
+)
+
+BASE_URL = "http://test/api/v1"
+
+def make_client(handler, **kwargs) -> UlroyClient:
+    client = UlroyClient(api_key="test-key", base_url=BASE_URL, **kwargs)
+    client._client.close()
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(handler), headers=client._headers, base_url=BASE_URL
+    )
+    return client
+
+async def make_async_client(handler, **kwargs) -> AsyncUlroyClient:
+    client = AsyncUlroyClient(api_key="test-key", base_url=BASE_URL, **kwargs)
+    await client._client.aclose()
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers=client._headers, base_url=BASE_URL
+    )
+    return client
+
+@pytest.mark.asyncio
+async def test_task_status_is_not_cached():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        status = "completed" if len(calls) >= 3 else "running"
+        return httpx.Response(200, json={"id": "t1", "status": status})
+
+    async with await make_async_client(handler, cache_size=16) as client:
+        status = await client.task.wait_for_completion("t1", poll_interval=0.01, timeout=5)
+    assert status.status == "completed"
+    assert len(calls) == 3
+
+@pytest.fixture
+def local_server():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if self.path.endswith("/events"):
+                return self.send_events()
+            body = b'{"ok": true}'
+            if "/tasks/" in self.path:
+                body = b'{"id": "t1", "status": "completed"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_events(self):
+            # A task that stays quiet for a while before it completes; "quiet"
+            # tasks never report at all and "chatty" ones only report progress
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.flush()
+            if "/chatty/" in self.path:
+                try:
+                    for _ in range(20):
+                        self.wfile.write(b'data: {"id": "t1", "status": "running"}\n\n')
+                        self.wfile.flush()
+                        time.sleep(0.25)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                return
+            time.sleep(5 if "/quiet/" in self.path else 0.5)
+            self.wfile.write(b'data: {"id": "t1", "status": "completed"}\n\n')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.block_on_close = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def test_shared_transport_survives_a_new_event_loop(local_server):
+    async def invoke():
+        async with AsyncUlroyClient(api_key="test-key", base_url=local_server, shared_transport=True) as client:
+            return await client.get("/ping")
+
+    # One asyncio.run per invocation, as in a serverless handler
+    assert asyncio.run(invoke()) == {"ok": True}
+    assert asyncio.run(invoke()) == {"ok": True}
+
+def test_quiet_task_stream_falls_back_to_polling(local_server):
+    started = time.monotonic()
+    with UlroyClient(api_key="test-key", base_url=local_server, timeout=0.2) as client:
+        status = poll_task_status_stream_sync(client, "quiet/t1", timeout=5)
+    assert status.status == "completed"
+    assert time.monotonic() - started < 2
+
+@pytest.mark.asyncio
+async def test_async_task_stream_outlasts_the_read_timeout(local_server):
+    async with AsyncUlroyClient(api_key="test-key", base_url=local_server, timeout=0.2) as client:
+        status = await poll_task_status_stream_async(client, "t1", timeout=5)
+    assert status.status == "completed"
+
+def test_task_stream_enforces_its_deadline(local_server):
+    started = time.monotonic()
+    with UlroyClient(api_key="test-key", base_url=local_server) as client:
+        with pytest.raises(TimeoutError):
+            poll_task_status_stream_sync(client, "quiet/t1", timeout=0.3)
+    assert time.monotonic() - started < 2
+
+def test_task_stream_deadline_holds_while_progress_arrives(local_server):
+    started = time.monotonic()
+    with UlroyClient(api_key="test-key", base_url=local_server) as client:
+        with pytest.raises(TimeoutError):
+            poll_task_status_stream_sync(client, "chatty/t1", timeout=0.5)
+    # The stream is read on this thread, so nothing is left holding it open
+    assert time.monotonic() - started < 1.5
+    assert [t for t in threading.enumerate() if not t.daemon] == [threading.main_thread()]
+
+def paged_handler(key, total, max_per_page):
+    """Serve ``total`` items under ``key``, capping the page size like a real server."""
+    def handler(request):
+        page = int(request.url.params["page"])
+        per_page = min(int(request.url.params["per_page"]), max_per_page)
+        start = (page - 1) * per_page
+        items = [{"id": str(i), "name": "n", "description": "d"} for i in range(start, min(start + per_page, total))]
+        return httpx.Response(200, json={key: items, "total": total, "page": page, "per_page": per_page})
+    return handler
+
+def test_list_all_follows_server_page_size():
+    with make_client(paged_handler("indexes", 120, 50)) as client:
+        listing = client.index.list_all(per_page=100)
+    assert [item["id"] for item in listing["indexes"]] == [str(i) for i in range(120)]
+
+@pytest.mark.asyncio
+async def test_async_list_all_follows_server_page_size():
+    async with await make_async_client(paged_handler("documents", 120, 50)) as client:
+        listing = await client.document.list_all(per_page=100)
+    assert [item["id"] for item in listing["documents"]] == [str(i) for i in range(120)]
+
+@pytest.mark.asyncio
+async def test_bulk_get_cancels_pending_requests_on_failure():
+    started, finished = [], []
+
+    async def handler(request):
+        doc_id = request.url.path.split("/")[-2]
+        started.append(doc_id)
+        if doc_id == "bad":
+            return httpx.Response(404, json={"message": "missing"})
+        await asyncio.sleep(0.5)
+        finished.append(doc_id)
+        return httpx.Response(200, json={"id": doc_id})
+
+    async with await make_async_client(handler) as client:
+        with pytest.raises(APIError):
+            await client.document.bulk_get("i1", ["a", "bad", "b"])
+        await asyncio.sleep(0.6)
+    assert finished == []
+
+def test_legacy_helpers_send_requests_and_wait_for_tasks():
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.url.path == "/api/v1/document/d1/delete":
+            return httpx.Response(200, json={"id": "t1", "status": "pending"})
+        if request.url.path == "/api/v1/tasks/t1":
+            return httpx.Response(200, json={"id": "t1", "status": "completed"})
+        return httpx.Response(200, json={"indexes": [], "total": 0, "page": 1, "per_page": 10})
+
+    with make_client(handler) as client:
+        documents = legacy.create_document_helpers_sync(client)
+        status = documents.delete_document("d1", poll_interval=0.01)
+        listing = legacy.create_index_helpers_sync(client).list_indexes(validate=True)
+    assert status.status == "completed"
+    assert listing.total == 0
+    assert requests == [
+        ("POST", "/api/v1/document/d1/delete"),
+        ("GET", "/api/v1/tasks/t1"),
+        ("GET", "/api/v1/index/list"),
+    ]
+
+@pytest.mark.asyncio
+async def test_poll_task_status_async_retries_transient_errors():
+    responses = iter([
+        httpx.Response(503, json={"message": "busy"}),
+        httpx.Response(200, json={"id": "t1", "status": "running"}),
+        httpx.Response(200, json={"id": "t1", "status": "completed"}),
+    ])
+
+    async with await make_async_client(lambda request: next(responses), max_retries=1) as client:
+        status = await poll_task_status_async(client, "t1", poll_interval=0.01, initial_poll_interval=0.01)
+    assert status.status == "completed"
+
+@pytest.mark.asyncio
+async def test_poll_task_status_async_error_backoff_respects_the_timeout():
+    started = time.monotonic()
+    async with await make_async_client(lambda request: httpx.Response(503), max_retries=1) as client:
+        with pytest.raises(TimeoutError):
+            await poll_task_status_async(client, "t1", poll_interval=5, timeout=0.3)
+    assert time.monotonic() - started < 1
+
+def delete_handler(sizes):
+    def handler(request):
+        ids = orjson.loads(request.content)["ids"]
+        sizes.append(len(ids))
+        return httpx.Response(200, json={"id": "t" + ids[0], "status": "pending"})
+
+    return handler
+
+def test_legacy_delete_index_entries_chunked_splits_large_deletes():
+    sizes = []
+    with make_client(delete_handler(sizes)) as client:
+        indexes = legacy.create_index_helpers_sync(client)
+        status = indexes.delete_index_entries("i1", ["a", "b"], wait=False)
+        statuses = indexes.delete_index_entries_chunked("i1", [str(i) for i in range(25_000)], wait=False)
+    assert isinstance(status, TaskStatus)
+    assert sorted(sizes) == [2, 5_000, 10_000, 10_000]
+    assert [s.id for s in statuses] == ["t0", "t10000", "t20000"]
+
+@pytest.mark.asyncio
+async def test_legacy_async_delete_index_entries_chunked_splits_large_deletes():
+    sizes = []
+    async with await make_async_client(delete_handler(sizes)) as client:
+        indexes = await legacy.create_index_helpers_async(client)
+        statuses = await indexes.delete_index_entries_chunked("i1", [str(i) for i in range(25)], batch_size=10, wait=False)
+    assert sorted(sizes) == [5, 10, 10]
+    assert [s.id for s in statuses] == ["t0", "t10", "t20"]
+
+def test_etag_cache_is_off_by_default_and_keyed_by_headers():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        lang = request.headers.get("Accept-Language", "en")
+        return httpx.Response(200, json={"lang": lang}, headers={"ETag": '"v1"'})
+
+    with make_client(handler) as client:
+        client.get("/index/i")
+        client.get("/index/i")
+    assert seen == [None, None]
+
+    seen.clear()
+    with make_client(handler, etag_cache_size=8) as client:
+        assert client.get("/index/i") == {"lang": "en"}
+        assert client.get("/index/i", headers={"Accept-Language": "fr"}) == {"lang": "fr"}
+        assert client.get("/index/i", headers={"Accept-Language": "fr"}) == {"lang": "fr"}
+    assert seen == [None, None, '"v1"']
+
+def counting_handler(status, headers=None):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(status, json={"message": "busy"}, headers=headers)
+
+    return handler, calls
+
+def test_get_retries_server_errors():
+    handler, calls = counting_handler(503)
+    with make_client(handler) as client:
+        client._backoff_base = 0.001
+        with pytest.raises(APIError) as exc_info:
+            client.get("/index/i")
+    assert exc_info.value.status_code == 503
+    assert calls == ["GET"] * 3
+
+def test_post_is_not_retried_on_server_errors():
+    handler, calls = counting_handler(503)
+    with make_client(handler) as client:
+        client._backoff_base = 0.001
+        with pytest.raises(APIError) as exc_info:
+            client.post("/index/i/add", json={"ids": ["a"]})
+    assert exc_info.value.status_code == 503
+    assert calls == ["POST"]
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_the_cap_is_raised_at_once():
+    handler, calls = counting_handler(429, headers={"Retry-After": "120"})
+    async with await make_async_client(handler) as client:
+        with pytest.raises(APIError) as exc_info:
+            await client.get("/index/i")
+    assert exc_info.value.retry_after == 120
+    assert calls == ["GET"]
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_reads():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(200, json={"id": "i", "version": len(calls)})
+
+    async with await make_async_client(handler, cache_size=16) as client:
+        first = await client.get("/index/i")
+        assert await client.get("/index/i") == first
+        await client.post("/index/i/update", json={"name": "x"})
+        assert await client.get("/index/i") != first
+    assert [method for method, _ in calls] == ["GET", "POST", "GET"]
+
+def test_not_modified_is_answered_from_the_etag_cache():
+    calls = []
+
+    def handler(request):
+        calls.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": "i", "name": "docs"}, headers={"ETag": '"v1"'})
+
+    with make_client(handler, etag_cache_size=8) as client:
+        first = client.get("/index/i")
+        second = client.get("/index/i")
+    assert first == second == {"id": "i", "name": "docs"}
+    assert second is not first
+    assert calls == [None, '"v1"']
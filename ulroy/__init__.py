@@ -18,6 +18,8 @@ from .helpers import (
     PaginatedResponse,
     IndexListResponse,
     DocumentListResponse,
+    IndexListResponseDict,
+    DocumentListResponseDict,
     TaskStatus
 )
 
@@ -32,5 +34,7 @@ __all__ = [
     "PaginatedResponse",
     "IndexListResponse",
     "DocumentListResponse",
+    "IndexListResponseDict",
+    "DocumentListResponseDict",
     "TaskStatus"
 ] 
\ No newline at end of file
@@ -1,24 +1,103 @@
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, AsyncIterator
+import asyncio
+import gzip
+import threading
 import httpx
-from .base import BaseClient, APIError
+from .base import BaseClient, _json_dumps, _cache_key, _endpoint_root, _ResponseCache, _GZIP_MIN_SIZE, _UNCACHED_ROOTS
 from .helpers.async_helpers import create_index_helpers, create_document_helpers, create_task_helpers
 
+# Transports used by clients created with shared_transport=True, one per
+# event loop: pooled connections belong to the loop that opened them
+_SHARED_TRANSPORTS: Dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+_SHARED_TRANSPORT_LOCK = threading.Lock()
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Per-client view of the running loop's shared transport whose close leaves the pool open."""
+
+    def __init__(self, http2: bool, limits: httpx.Limits):
+        self._http2 = http2
+        self._limits = limits
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = _get_shared_transport(self._http2, self._limits)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # The pool outlives individual clients; see AsyncUlroyClient.shutdown_shared
+        pass
+
+def _get_shared_transport(http2: bool, limits: httpx.Limits) -> httpx.AsyncHTTPTransport:
+    loop = asyncio.get_running_loop()
+    with _SHARED_TRANSPORT_LOCK:
+        transport = _SHARED_TRANSPORTS.get(loop)
+        if transport is None:
+            # Connections of a closed loop can never be used again
+            for closed in [other for other in _SHARED_TRANSPORTS if other.is_closed()]:
+                del _SHARED_TRANSPORTS[closed]
+            transport = _SHARED_TRANSPORTS[loop] = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        return transport
+
 class AsyncUlroyClient(BaseClient):
     """Asynchronous client for the Ulroy API."""
     
+    __slots__ = ("_client", "_cache", "_compress_requests", "index", "document", "task")
+    
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.ulroy.com/v1",
         timeout: float = 30.0,
         max_retries: int = 3,
+        http2: bool = True,
+        pool_size: int = 200,
+        shared_transport: bool = False,
+        cache_size: int = 0,
+        cache_ttl: float = 60.0,
+        compress_requests: bool = False,
     ):
+        """
+        Initialize the async client.
+
+        With ``shared_transport=True`` the client borrows a connection pool
+        shared by every such client on the same event loop instead of opening
+        its own, so short-lived clients reuse warm connections. Each loop's
+        pool is created on its first request (with that client's
+        ``http2``/``pool_size`` settings) and stays open after the clients
+        close, until ``AsyncUlroyClient.shutdown_shared()`` is awaited on that
+        loop or the loop is closed.
+
+        A positive ``cache_size`` enables an in-memory LRU cache of up to that
+        many GET responses, each kept for ``cache_ttl`` seconds. Any POST, PUT
+        or DELETE drops cached responses under the same resource (``/index``,
+        ``/document``, ...). Task status and responses marked
+        ``Cache-Control: no-store`` are never cached.
+
+        With ``compress_requests=True``, JSON bodies larger than 4 KB are sent
+        gzip-compressed with ``Content-Encoding: gzip``; only enable this
+        against servers that accept compressed requests. Compressed responses
+        are decoded by httpx, which advertises every encoding it can handle
+        (``br`` too, once the ``compression`` extra is installed).
+        """
         super().__init__(api_key, base_url, timeout, max_retries)
+        self._client: Optional[httpx.AsyncClient] = None
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=min(pool_size, 50),
+            keepalive_expiry=30.0,
+        )
+        transport = None
+        if shared_transport:
+            transport = _SharedTransport(http2, limits)
         self._client = httpx.AsyncClient(
-            timeout=timeout,
+            http2=http2,
+            limits=limits,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
             headers=self._headers,
             base_url=self.base_url,
+            transport=transport,
         )
+        self._cache = _ResponseCache(cache_size, cache_ttl) if cache_size > 0 else None
+        self._compress_requests = compress_requests
         
         # Initialize helper functions as None - they will be set in __aenter__
         self.index = None
@@ -37,10 +116,18 @@ class AsyncUlroyClient(BaseClient):
 
     async def close(self):
         """Close the HTTP client."""
-        if hasattr(self, '_client') and self._client is not None:
+        if self._client is not None:
             await self._client.aclose()
             self._client = None
 
+    @classmethod
+    async def shutdown_shared(cls):
+        """Close the running loop's transport used by ``shared_transport`` clients."""
+        with _SHARED_TRANSPORT_LOCK:
+            transport = _SHARED_TRANSPORTS.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
     async def _request(
         self,
         method: str,
@@ -48,28 +135,99 @@ class AsyncUlroyClient(BaseClient):
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: bool = False,
+        cache_key: Optional[tuple] = None,
     ) -> Dict[str, Any]:
-        """Make an HTTP request with retry logic."""
-        if not hasattr(self, '_client') or self._client is None:
+        """
+        Make an HTTP request with retry logic.
+
+        Connection errors are always retried. Retryable API errors (408, 429
+        and 5xx) are only retried for idempotent methods, or for any method when
+        ``idempotent`` is set. Attempts are spaced with exponential backoff and
+        jitter, or by the server's ``Retry-After`` when present.
+        """
+        if self._client is None:
+            raise RuntimeError("Client is closed")
+        
+        # Encode the query and body once up front so retries resend the same
+        # snapshot. orjson is used instead of httpx's stdlib json; the client's
+        # default headers already declare application/json
+        query = httpx.QueryParams(params) if params else None
+        content = _json_dumps(json) if json is not None else None
+        if self._compress_requests and content is not None and len(content) > _GZIP_MIN_SIZE:
+            # Level 1 gets most of the size win on JSON for little CPU
+            content = gzip.compress(content, compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        
+        try:
+            for attempt in range(self.max_retries):
+                try:
+                    response = await self._client.request(
+                        method=method,
+                        # Relative endpoints are joined onto base_url by httpx itself
+                        url=endpoint,
+                        params=query,
+                        content=content,
+                        # self._headers are already client defaults; only send extras
+                        headers=headers,
+                    )
+                    if attempt < self.max_retries - 1:
+                        self._raise_if_retrying(response, method, idempotent)
+                    data = self._handle_response(response)
+                    if cache_key is not None and "no-store" not in response.headers.get("Cache-Control", ""):
+                        self._cache.set(cache_key, data)
+                    return data
+                except self._RETRYABLE as e:
+                    if attempt == self.max_retries - 1 or not self._is_retryable(e, method, idempotent):
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt, e))
+        finally:
+            # A write may have changed server state whether or not it succeeded
+            if self._cache is not None and method != "GET":
+                self._cache.invalidate(endpoint)
+
+    async def _request_stream(
+        self,
+        method: str,
+        endpoint: str,
+        prefix: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Make an HTTP request and yield the JSON items found at ``prefix``
+        (an ijson prefix such as ``"results.item"``) as the body arrives.
+
+        The body is never held in memory as a whole. Streamed requests are not
+        retried, since a partly consumed response cannot be replayed.
+        """
+        try:
+            import ijson
+        except ImportError as e:
+            raise ImportError(
+                "Streaming responses require ijson; install it with `pip install ulroy[stream]`"
+            ) from e
+        if self._client is None:
             raise RuntimeError("Client is closed")
-            
-        url = self._build_url(endpoint)
-        headers = self._get_headers(headers)
         
-        for attempt in range(self.max_retries):
-            try:
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    headers=headers,
-                )
-                return self._handle_response(response)
-            except (httpx.RequestError, APIError) as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                continue
+        content = _json_dumps(json) if json is not None else None
+        async with self._client.stream(
+            method, endpoint, params=params, content=content, headers=headers
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._handle_response(response)
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, prefix, use_float=True)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
 
     async def get(
         self,
@@ -77,17 +235,25 @@ class AsyncUlroyClient(BaseClient):
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        """Make a GET request."""
-        return await self._request("GET", endpoint, params=params, headers=headers)
+        """Make a GET request, answered from the response cache when enabled."""
+        cache_key = None
+        if self._cache is not None and not headers and _endpoint_root(endpoint) not in _UNCACHED_ROOTS:
+            cache_key = _cache_key(endpoint, params)
+            if cache_key is not None:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
+        return await self._request("GET", endpoint, params=params, headers=headers, cache_key=cache_key)
 
     async def post(
         self,
         endpoint: str,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: bool = False,
     ) -> Dict[str, Any]:
-        """Make a POST request."""
-        return await self._request("POST", endpoint, json=json, headers=headers)
+        """Make a POST request. Set ``idempotent`` to allow retrying on server errors."""
+        return await self._request("POST", endpoint, json=json, headers=headers, idempotent=idempotent)
 
     async def put(
         self,
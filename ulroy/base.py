@@ -1,21 +1,196 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Hashable, List, Tuple
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from types import MappingProxyType
 from pydantic import BaseModel, Field
+import random
+import threading
+import time
 import httpx
+import orjson
+
+# Headers shared by every client; only Authorization varies per instance
+_STATIC_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+})
+
+# Request bodies above this many bytes are gzipped when compression is enabled
+_GZIP_MIN_SIZE = 4096
+
+# Statuses worth retrying: timeouts, rate limiting and transient server errors
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a request body to JSON bytes with orjson."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+# Resources whose state changes without a write from this client, so their
+# GETs must never be answered from the response cache
+_UNCACHED_ROOTS = frozenset({"task", "tasks"})
+
+def _endpoint_root(endpoint: str) -> str:
+    """First path segment of an endpoint, e.g. ``document`` for ``/document/1/info``."""
+    return endpoint.lstrip("/").split("/", 1)[0]
+
+
+def _cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> Optional[Tuple[Hashable, ...]]:
+    """Key a GET by endpoint and query params, or None if the params aren't hashable."""
+    key = (_endpoint_root(endpoint), endpoint, tuple(sorted((params or {}).items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _ResponseCache:
+    """
+    LRU cache of GET response bodies with a fixed time-to-live.
+
+    Bodies are stored as JSON bytes and decoded on every hit, so callers
+    always get a fresh object they are free to mutate.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return orjson.loads(body)
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, orjson.dumps(value))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop every entry under the same resource root as ``endpoint``."""
+        root = _endpoint_root(endpoint)
+        for key in [key for key in self._entries if key[0] == root]:
+            del self._entries[key]
+
+
+class _ETagCache:
+    """
+    LRU cache of GET response bodies keyed by request, each stored with the
+    ``ETag`` it was served with.
+
+    Entries never expire: the ETag is sent back as ``If-None-Match`` and the
+    server decides whether the stored body is still current. Access is locked
+    because the sync helpers share one client across a thread pool.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Tuple[Hashable, ...], etag: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
 
 class UlroyError(Exception):
     """Base exception for Ulroy client errors."""
     pass
 
 class APIError(UlroyError):
-    """Exception raised when the API returns an error."""
-    def __init__(self, status_code: int, message: str):
+    """
+    Exception raised when the API returns an error.
+
+    ``body`` holds the decoded JSON error payload (None if the body was not
+    JSON) and ``headers`` the response headers, so callers can inspect the
+    error without parsing the response again.
+    """
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        *,
+        body: Any = None,
+        headers: Optional[httpx.Headers] = None,
+    ):
         self.status_code = status_code
         self.message = message
+        self.body = body
+        self.headers = headers if headers is not None else httpx.Headers()
         super().__init__(f"API Error {status_code}: {message}")
 
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds the server asked us to wait before retrying, if it said."""
+        return _parse_retry_after(self.headers.get("Retry-After"))
+
+class BulkOperationError(UlroyError):
+    """
+    Raised when a bulk request succeeded overall but some items failed.
+
+    ``failed`` holds the per-item results that carry an ``error`` and
+    ``items`` every per-item result, in request order.
+    """
+    def __init__(self, failed: List[Dict[str, Any]], items: List[Dict[str, Any]]):
+        self.failed = failed
+        self.items = items
+        super().__init__(f"{len(failed)} of {len(items)} items failed")
+
 class BaseClient:
     """Base client class with common functionality."""
     
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "timeout",
+        "max_retries",
+        "_backoff_base",
+        "_backoff_cap",
+        "_auth",
+        "_headers",
+    )
+
+    # Exceptions a request attempt may be retried on; _is_retryable decides
+    _RETRYABLE = (httpx.TransportError, APIError)
+    
     def __init__(
         self,
         api_key: str,
@@ -36,31 +211,79 @@ class BaseClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
-        self._headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        self._backoff_base = 0.1
+        self._backoff_cap = 10.0
+        self._auth = f"Bearer {api_key}"
+        self._headers = {"Authorization": self._auth, **_STATIC_HEADERS}
 
     def _build_url(self, endpoint: str) -> str:
-        """Build the full URL for an endpoint."""
+        """
+        Build the full URL for an endpoint.
+
+        Deprecated: the clients pass endpoints straight to httpx, which joins
+        them onto ``base_url``. Kept for backwards compatibility.
+        """
         return f"{self.base_url}/{endpoint.lstrip('/')}"
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle the API response and raise appropriate exceptions."""
         if response.status_code >= 400:
+            body = None
             try:
-                error_data = response.json()
-                message = error_data.get("message", "Unknown error")
-            except ValueError:
+                body = orjson.loads(response.content)
+                message = body.get("message", "Unknown error")
+            except (ValueError, AttributeError):
                 message = response.text or "Unknown error"
-            raise APIError(response.status_code, message)
+            raise APIError(response.status_code, message, body=body, headers=response.headers)
         
-        return response.json()
+        return orjson.loads(response.content)
+
+    def _raise_if_retrying(self, response: httpx.Response, method: str, idempotent: bool = False) -> None:
+        """
+        Raise an APIError without decoding the body if ``response`` is an
+        error that will be retried, since the body is thrown away with the attempt.
+        """
+        if response.status_code not in _RETRYABLE_STATUS:
+            return
+        error = APIError(response.status_code, response.reason_phrase, headers=response.headers)
+        if self._is_retryable(error, method, idempotent):
+            raise error
+
+    def _is_retryable(self, exc: Exception, method: str, idempotent: bool = False) -> bool:
+        """
+        Whether a failed request may safely be sent again.
+
+        A ``Retry-After`` longer than the backoff cap is not retried: coming
+        back sooner than the server asked would only be refused again, so the
+        error is raised for the caller to reschedule using its ``retry_after``.
+        """
+        if isinstance(exc, httpx.TransportError):
+            return True
+        if isinstance(exc, APIError):
+            if exc.status_code not in _RETRYABLE_STATUS:
+                return False
+            if not (idempotent or method.upper() in _IDEMPOTENT_METHODS):
+                return False
+            retry_after = exc.retry_after
+            return retry_after is None or retry_after <= self._backoff_cap
+        return False
+
+    def _retry_delay(self, attempt: int, exc: Exception) -> float:
+        """Seconds to wait before retrying, honoring Retry-After when the server sent one."""
+        retry_after = exc.retry_after if isinstance(exc, APIError) else None
+        if retry_after is not None:
+            return min(self._backoff_cap, retry_after)
+        # Full jitter: spread retries over the whole backoff window so clients
+        # that failed together don't come back together
+        return random.uniform(0, min(self._backoff_cap, self._backoff_base * (2 ** attempt)))
 
     def _get_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Get headers with optional additional headers."""
-        headers = self._headers.copy()
-        if additional_headers:
-            headers.update(additional_headers)
-        return headers 
\ No newline at end of file
+        """
+        Get headers with optional additional headers.
+
+        Without additional headers the shared ``self._headers`` dict is returned
+        as-is, so callers must treat the result as read-only.
+        """
+        if not additional_headers:
+            return self._headers
+        return {**self._headers, **additional_headers} 
\ No newline at end of file
@@ -1,3 +1,5 @@
-class APIError(Exception):
-    """Base exception for API-related errors"""
-    pass 
\ No newline at end of file
+# The client raises these from ulroy.base; they are re-exported here so that
+# `except ulroy.exceptions.APIError` catches the errors requests really raise
+from .base import UlroyError, APIError, BulkOperationError
+
+__all__ = ["UlroyError", "APIError", "BulkOperationError"]
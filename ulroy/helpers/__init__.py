@@ -1,7 +1,10 @@
 from .async_helpers import (
     create_index_helpers,
     create_document_helpers,
-    create_task_helpers,
+    create_task_helpers
+)
+
+from ._models import (
     IndexInfo,
     DocumentInfo,
     QueryRequest,
@@ -11,6 +14,8 @@ from .async_helpers import (
     PaginatedResponse,
     IndexListResponse,
     DocumentListResponse,
+    IndexListResponseDict,
+    DocumentListResponseDict,
     TaskStatus
 )
 
@@ -20,6 +25,13 @@ from .sync_helpers import (
     create_task_helpers as create_task_helpers_sync
 )
 
+from .legacy import (
+    poll_task_status_sync,
+    poll_task_status_async,
+    poll_task_status_stream_sync,
+    poll_task_status_stream_async
+)
+
 __all__ = [
     'create_index_helpers',
     'create_document_helpers',
@@ -27,6 +39,10 @@ __all__ = [
     'create_index_helpers_sync',
     'create_document_helpers_sync',
     'create_task_helpers_sync',
+    'poll_task_status_sync',
+    'poll_task_status_async',
+    'poll_task_status_stream_sync',
+    'poll_task_status_stream_async',
     'IndexInfo',
     'DocumentInfo',
     'QueryRequest',
@@ -36,5 +52,7 @@ __all__ = [
     'PaginatedResponse',
     'IndexListResponse',
     'DocumentListResponse',
+    'IndexListResponseDict',
+    'DocumentListResponseDict',
     'TaskStatus'
 ] 
\ No newline at end of file
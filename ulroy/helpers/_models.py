@@ -0,0 +1,129 @@
+from typing import Optional, List, Dict, Any, Iterable, NamedTuple, Tuple, TypedDict
+from pydantic import BaseModel, ConfigDict
+
+# Shared stand-in for a missing result list, so a lookup allocates nothing
+_EMPTY: tuple = ()
+
+# Task states after which a task will not change again
+_TERMINAL = frozenset(("completed", "failed"))
+
+def _remaining_pages(first: Dict[str, Any], per_page: int) -> Tuple[int, range]:
+    """Page size and page numbers still to fetch after the first page of a listing"""
+    # The server may cap the page size below what was asked for
+    per_page = first.get("per_page") or per_page
+    return per_page, range(2, -(-first["total"] // per_page) + 1)
+
+def _merge_pages(first: Dict[str, Any], key: str, pages: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge the ``key`` items of every page into the first page's listing"""
+    items = first[key]
+    for page in pages:
+        items.extend(page[key])
+    return {**first, key: items}
+
+class _FrozenModel(BaseModel):
+    """
+    Base for read-only API records. Instances are immutable and ignore
+    fields the server adds, so they can be shared and cached freely.
+    """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+class IndexInfo(_FrozenModel):
+    """Information about an index"""
+    id: str
+    name: str
+    description: str
+
+class DocumentInfo(_FrozenModel):
+    """Information about a document"""
+    id: str
+    name: str
+    description: Optional[str] = None
+
+# Request bodies are built from arguments the helpers already typed, so
+# they are plain tuples rather than validated models
+
+class QueryRequest(NamedTuple):
+    """Request for querying an index or document"""
+    text: str
+    k: int = 10
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"text": self.text, "k": self.k}
+
+class DocumentQuery(NamedTuple):
+    """Request for querying a document"""
+    query: str
+    k: int = 10
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"query": self.query, "k": self.k}
+
+class HybridSearchRequest(NamedTuple):
+    """Request for hybrid search"""
+    text: str
+    k: int = 10
+    vector_weight: float = 0.5
+    text_weight: float = 0.5
+    min_text_score: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "text": self.text,
+            "k": self.k,
+            "vector_weight": self.vector_weight,
+            "text_weight": self.text_weight,
+            "min_text_score": self.min_text_score
+        }
+
+class UpdateMetadataRequest(NamedTuple):
+    """Request for updating metadata"""
+    primary_id: str
+    metadata: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"primary_id": self.primary_id, "metadata": self.metadata}
+
+class PaginatedResponse(BaseModel):
+    """Base class for paginated responses"""
+    total: int
+    page: int
+    per_page: int
+
+class IndexListResponse(PaginatedResponse):
+    """Response for listing indexes"""
+    indexes: List[IndexInfo]
+
+class DocumentListResponse(PaginatedResponse):
+    """Response for listing documents"""
+    documents: List[DocumentInfo]
+
+class IndexListResponseDict(TypedDict):
+    """Unvalidated index listing, as returned by the API"""
+    total: int
+    page: int
+    per_page: int
+    indexes: List[Dict[str, Any]]
+
+class DocumentListResponseDict(TypedDict):
+    """Unvalidated document listing, as returned by the API"""
+    total: int
+    page: int
+    per_page: int
+    documents: List[Dict[str, Any]]
+
+class TaskStatus(_FrozenModel):
+    """Status of a task"""
+    id: str
+    status: str
+    progress: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+
+# Compiled pydantic-core validators, looked up once instead of going through
+# the model class on every response. model_construct is not a faster
+# alternative on pydantic 2: it runs in Python and is several times slower
+# than these validators, so callers that trust the server skip models
+# entirely and take the raw dict (validate=False)
+_VALIDATORS = {
+    cls: cls.__pydantic_validator__
+    for cls in (IndexListResponse, DocumentListResponse, TaskStatus, IndexInfo, DocumentInfo)
+}
@@ -1,163 +1,212 @@
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel
+from typing import Optional, List, Dict, Any, Union, Sequence, AsyncIterator
 import asyncio
 import time
 from datetime import datetime, timedelta
 from ulroy.exceptions import APIError
+# The models used to be defined here; the unused ones are still imported so
+# code importing them from this module keeps working
+from ._models import (
+    IndexInfo, DocumentInfo, QueryRequest, DocumentQuery,
+    HybridSearchRequest, UpdateMetadataRequest, PaginatedResponse,
+    IndexListResponse, DocumentListResponse, TaskStatus,
+    IndexListResponseDict, DocumentListResponseDict, _VALIDATORS,
+    _EMPTY, _TERMINAL, _remaining_pages, _merge_pages
+)
+
+_EP_INDEX_CREATE = "/index/create"
+_EP_INDEX_LIST = "/index/list"
+_EP_INDEX_INFO = "/index/{}/info"
+_EP_INDEX_DELETE = "/index/{}/delete-complete"
+_EP_DOC_LIST = "/document/list"
+_EP_DOC_INFO = "/document/{}/info"
+_EP_DOC_DELETE = "/document/{}/delete"
+_EP_DOC_INDEX = "/document/{}/index"
+_EP_DOC_QUERY = "/document/{}/index/query"
+_EP_DOC_RESEARCH = "/document/{}/research/index"
+_EP_DOC_RESEARCH_QUERY = "/document/{}/research/{}/query"
+_EP_TASK = "/tasks/{}"
+
+async def _gather_limited(func, args_list: List[tuple], concurrency: int) -> List[Any]:
+    """Await ``func(*args)`` for every args tuple, at most ``concurrency`` at once; the first failure cancels the rest"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(args):
+        async with semaphore:
+            return await func(*args)
+
+    tasks = [asyncio.ensure_future(run(args)) for args in args_list]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+async def _list_all_pages(list_page, key: str, per_page: int, search: Optional[str], concurrency: int) -> Dict[str, Any]:
+    """
+    Fetch the first page with ``list_page``, then every remaining page at once,
+    and merge the ``key`` items of all pages into a single listing
+    """
+    first = await list_page(1, per_page, search)
+    per_page, rest = _remaining_pages(first, per_page)
+    pages = await _gather_limited(list_page, [(page, per_page, search) for page in rest], concurrency)
+    return _merge_pages(first, key, pages)
+
+class IndexHelpers:
+    """Async index helpers bound to a client"""
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
 
-class IndexInfo(BaseModel):
-    """Information about an index"""
-    id: str
-    name: str
-    description: str
-
-class DocumentInfo(BaseModel):
-    """Information about a document"""
-    id: str
-    name: str
-    description: Optional[str] = None
-
-class QueryRequest(BaseModel):
-    """Request for querying an index or document"""
-    text: str
-    k: int = 10
-
-class DocumentQuery(BaseModel):
-    """Request for querying a document"""
-    query: str
-    k: int = 10
-
-class HybridSearchRequest(BaseModel):
-    """Request for hybrid search"""
-    text: str
-    k: int = 10
-    vector_weight: float = 0.5
-    text_weight: float = 0.5
-    min_text_score: float = 0.0
-
-class UpdateMetadataRequest(BaseModel):
-    """Request for updating metadata"""
-    primary_id: str
-    metadata: Dict[str, Any]
-
-class PaginatedResponse(BaseModel):
-    """Base class for paginated responses"""
-    total: int
-    page: int
-    per_page: int
-
-class IndexListResponse(PaginatedResponse):
-    """Response for listing indexes"""
-    indexes: List[IndexInfo]
-
-class DocumentListResponse(PaginatedResponse):
-    """Response for listing documents"""
-    documents: List[DocumentInfo]
-
-class TaskStatus(BaseModel):
-    """Status of a task"""
-    id: str
-    status: str
-    progress: Optional[float] = None
-    result: Optional[Dict[str, Any]] = None
-
-async def create_index_helpers(client):
-    """Create async index helper functions"""
     async def create(self, index_config: Dict[str, Any]) -> str:
         """Create a new index"""
-        response = await client.post("/index/create", json=index_config)
+        response = await self._client.post(_EP_INDEX_CREATE, json=index_config)
         return response["index_id"]
 
-    async def list(self, page: int = 1, per_page: int = 10, search: Optional[str] = None) -> IndexListResponse:
-        """List all indexes"""
+    async def list_indexes(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        validate: bool = False
+    ) -> Union[IndexListResponseDict, IndexListResponse]:
+        """List all indexes; pass validate=True to get an IndexListResponse instead of the raw dict"""
         params = {"page": page, "per_page": per_page}
         if search:
             params["search"] = search
-        response = await client.get("/index/list", params=params)
-        return IndexListResponse(**response)
+        response = await self._client.get(_EP_INDEX_LIST, params=params)
+        if validate:
+            return _VALIDATORS[IndexListResponse].validate_python(response)
+        return response
+
+    list = list_indexes
+
+    async def list_all(
+        self,
+        per_page: int = 100,
+        search: Optional[str] = None,
+        concurrency: int = 16
+    ) -> IndexListResponseDict:
+        """List every index, fetching the pages after the first concurrently"""
+        return await _list_all_pages(self.list_indexes, "indexes", per_page, search, concurrency)
 
     async def get(self, index_id: str) -> Dict[str, Any]:
         """Get index details"""
-        return await client.get(f"/index/{index_id}/info")
+        return await self._client.get(_EP_INDEX_INFO.format(index_id))
 
     async def delete(self, index_id: str) -> Dict[str, Any]:
         """Delete an index"""
-        return await client.post(f"/index/{index_id}/delete-complete")
-
-    return type("IndexHelpers", (), {
-        "create": create,
-        "list": list,
-        "get": get,
-        "delete": delete
-    })()
-
-async def create_document_helpers(client):
-    """Create async document helper functions"""
-    class DocumentHelpers:
-        async def add(self, index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
-            """Add a document to an index"""
-            # Note: This endpoint requires file upload and metadata as form data
-            # The current implementation needs to be updated to handle file uploads
-            raise NotImplementedError("Document creation requires file upload. Use the appropriate file upload method.")
-
-        async def get(self, index_id: str, doc_id: str) -> Dict[str, Any]:
-            """Get a document from an index"""
-            return await client.get(f"/document/{doc_id}/info")
-
-        async def update(self, index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
-            """Update a document in an index"""
-            # Note: The API doesn't have a direct update endpoint for documents
-            raise NotImplementedError("Document update is not supported by the API")
-
-        async def delete(self, index_id: str, doc_id: str) -> Dict[str, Any]:
-            """Delete a document from an index"""
-            return await client.post(f"/document/{doc_id}/delete")
-
-        async def search(self, index_id: str, query: str, k: int = 10) -> List[Dict[str, Any]]:
-            """Search documents in an index"""
-            response = await client.post(f"/document/{index_id}/index/query", json={"query": query, "k": k})
-            return response.get("results", [])
-
-        async def list(self, page: int = 1, per_page: int = 10, search: Optional[str] = None) -> Dict[str, Any]:
-            """List all documents with pagination and search"""
-            params = {"page": page, "per_page": per_page}
-            if search:
-                params["search"] = search
-            return await client.get("/document/list", params=params)
-
-        async def index(self, doc_id: str) -> Dict[str, Any]:
-            """Index a document"""
-            return await client.post(f"/document/{doc_id}/index")
-
-        async def research(self, doc_id: str, query: str, k: int = 10) -> Dict[str, Any]:
-            """Research a document"""
-            return await client.post(f"/document/{doc_id}/research/index", json={"query": query, "k": k})
-
-        async def query_research(self, doc_id: str, research_id: str, query: str, k: int = 10) -> List[Dict[str, Any]]:
-            """Query a specific research within a document"""
-            return await client.post(f"/document/{doc_id}/research/{research_id}/query", json={"query": query, "k": k})
-
-    return DocumentHelpers()
-
-async def create_task_helpers(client):
-    """Create async task helper functions"""
-    async def get_status(task_id: str) -> TaskStatus:
-        """Get task status"""
-        response = await client.get(f"/tasks/{task_id}")
-        return TaskStatus(**response)
+        return await self._client.post(_EP_INDEX_DELETE.format(index_id))
+
+class DocumentHelpers:
+    """Async document helpers bound to a client"""
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
+
+    async def add(self, index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a document to an index"""
+        # Note: This endpoint requires file upload and metadata as form data
+        # The current implementation needs to be updated to handle file uploads
+        raise NotImplementedError("Document creation requires file upload. Use the appropriate file upload method.")
+
+    async def get(self, index_id: str, doc_id: str) -> Dict[str, Any]:
+        """Get a document from an index"""
+        return await self._client.get(_EP_DOC_INFO.format(doc_id))
+
+    async def update(self, index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a document in an index"""
+        # Note: The API doesn't have a direct update endpoint for documents
+        raise NotImplementedError("Document update is not supported by the API")
+
+    async def delete(self, index_id: str, doc_id: str) -> Dict[str, Any]:
+        """Delete a document from an index"""
+        return await self._client.post(_EP_DOC_DELETE.format(doc_id))
+
+    async def bulk_get(self, index_id: str, doc_ids: List[str], concurrency: int = 10) -> List[Dict[str, Any]]:
+        """Get several documents concurrently"""
+        return await _gather_limited(self.get, [(index_id, doc_id) for doc_id in doc_ids], concurrency)
+
+    async def bulk_delete(self, index_id: str, doc_ids: List[str], concurrency: int = 10) -> List[Dict[str, Any]]:
+        """Delete several documents concurrently"""
+        return await _gather_limited(self.delete, [(index_id, doc_id) for doc_id in doc_ids], concurrency)
+
+    async def search(self, index_id: str, query: str, k: int = 10, stream: bool = False) -> Union[Sequence[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]:
+        """Search documents in an index; an empty tuple if the response has no results. With ``stream=True``, returns an async iterator over the results"""
+        endpoint = _EP_DOC_QUERY.format(index_id)
+        if stream:
+            return self._client._request_stream("POST", endpoint, "results.item", json={"query": query, "k": k})
+        response = await self._client.post(endpoint, json={"query": query, "k": k})
+        return response.get("results", _EMPTY)
+
+    async def list_documents(self, page: int = 1, per_page: int = 10, search: Optional[str] = None, stream: bool = False) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """List all documents with pagination and search. With ``stream=True``, returns an async iterator over the documents"""
+        params = {"page": page, "per_page": per_page}
+        if search:
+            params["search"] = search
+        if stream:
+            return self._client._request_stream("GET", _EP_DOC_LIST, "documents.item", params=params)
+        return await self._client.get(_EP_DOC_LIST, params=params)
+
+    list = list_documents
+
+    async def list_all(self, per_page: int = 100, search: Optional[str] = None, concurrency: int = 16) -> DocumentListResponseDict:
+        """List every document, fetching the pages after the first concurrently"""
+        return await _list_all_pages(self.list_documents, "documents", per_page, search, concurrency)
+
+    async def index(self, doc_id: str) -> Dict[str, Any]:
+        """Index a document"""
+        return await self._client.post(_EP_DOC_INDEX.format(doc_id))
+
+    async def research(self, doc_id: str, query: str, k: int = 10) -> Dict[str, Any]:
+        """Research a document"""
+        return await self._client.post(_EP_DOC_RESEARCH.format(doc_id), json={"query": query, "k": k})
 
-    async def wait_for_completion(task_id: str, poll_interval: float = 1.0, timeout: float = 300.0) -> TaskStatus:
-        """Wait for a task to complete"""
-        start_time = time.time()
+    async def query_research(self, doc_id: str, research_id: str, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """Query a specific research within a document"""
+        return await self._client.post(_EP_DOC_RESEARCH_QUERY.format(doc_id, research_id), json={"query": query, "k": k})
+
+class TaskHelpers:
+    """Async task helpers bound to a client"""
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
+
+    async def get_status(self, task_id: str) -> TaskStatus:
+        """Get task status"""
+        response = await self._client.get(_EP_TASK.format(task_id))
+        return _VALIDATORS[TaskStatus].validate_python(response)
+
+    async def wait_for_completion(
+        self,
+        task_id: str,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        initial_delay: float = 0.0
+    ) -> TaskStatus:
+        """Wait for a task to complete; the first check is immediate unless initial_delay is set"""
+        deadline = time.monotonic() + timeout
+        if initial_delay > 0:
+            await asyncio.sleep(initial_delay)
         while True:
-            status = await get_status(task_id)
-            if status.status in ["completed", "failed"]:
-                return status
-            if time.time() - start_time > timeout:
+            if time.monotonic() >= deadline:
                 raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
-            await asyncio.sleep(poll_interval)
+            status = await self.get_status(task_id)
+            if status.status in _TERMINAL:
+                return status
+            await asyncio.sleep(max(0.0, min(poll_interval, deadline - time.monotonic())))
+
+async def create_index_helpers(client) -> IndexHelpers:
+    """Create async index helpers"""
+    return IndexHelpers(client)
+
+async def create_document_helpers(client) -> DocumentHelpers:
+    """Create async document helpers"""
+    return DocumentHelpers(client)
 
-    return type("TaskHelpers", (), {
-        "get_status": get_status,
-        "wait_for_completion": wait_for_completion
-    })() 
\ No newline at end of file
+async def create_task_helpers(client) -> TaskHelpers:
+    """Create async task helpers"""
+    return TaskHelpers(client)
@@ -0,0 +1,854 @@
+from typing import Optional, List, Dict, Any, Union
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import orjson
+from ..exceptions import APIError
+from ..base import _RETRYABLE_STATUS
+from ._models import (
+    IndexListResponse, DocumentListResponse, TaskStatus,
+    IndexListResponseDict, DocumentListResponseDict, _VALIDATORS, _TERMINAL
+)
+
+# Endpoint templates, filled with % so hot paths skip f-string formatting
+_TASK = "/tasks/%s"
+_TASK_EVENTS = "/task/%s/events"
+_INDEX_INFO = "/index/%s/info"
+_INDEX_QUERY = "/index/%s/query"
+_INDEX_HYBRID = "/index/%s/hybrid-search"
+_INDEX_UPDATE = "/index/%s/update"
+_INDEX_DELETE = "/index/%s/delete"
+_INDEX_ENTRIES = "/index/%s/entries"
+_INDEX_DELETE_COMPLETE = "/index/%s/delete-complete"
+_DOC_INFO = "/document/%s/info"
+_DOC_QUERY = "/document/%s/index/query"
+_DOC_RESEARCH = "/document/%s/research/index"
+_DOC_RESEARCH_QUERY = "/document/%s/research/%s/query"
+_DOC_DELETE = "/document/%s/delete"
+_DOC_INDEX = "/document/%s/index"
+
+# Threads used by the sync delete_index_entries_batch to send lists in parallel
+_DELETE_WORKERS = 8
+
+# Most ids delete_index_entries_chunked puts in one request
+_DELETE_BATCH_SIZE = 10_000
+
+# poll_task_status_async gives up after this many failed polls in a row,
+# backing off up to _MAX_ERROR_DELAY seconds between them
+_MAX_CONSECUTIVE_ERRORS = 5
+_MAX_ERROR_DELAY = 30.0
+
+def _poll_delay(attempt: int, initial_poll_interval: float, poll_interval: float) -> float:
+    """
+    Delay before the next status poll: starts at initial_poll_interval and
+    doubles each attempt up to poll_interval, plus up to 10% jitter.
+    """
+    delay = min(poll_interval, initial_poll_interval * (2 ** min(attempt, 32)))
+    return delay + random.uniform(0, initial_poll_interval * 0.1)
+
+def poll_task_status_sync(
+    client,
+    task_id: str,
+    poll_interval: float = 1.0,
+    timeout: float = 300.0,
+    raise_on_error: bool = True,
+    initial_poll_interval: float = 0.05,
+    initial_delay: float = 0.0
+) -> TaskStatus:
+    """
+    Poll a task until it completes or times out (synchronous version).
+    
+    This blocks the calling thread between polls, so it must not be called
+    from a thread running an event loop; use poll_task_status_async there.
+    
+    Args:
+        client: The client instance
+        task_id: ID of the task to poll
+        poll_interval: Longest time between polls in seconds
+        timeout: Maximum time to wait in seconds
+        raise_on_error: Whether to raise an exception if the task fails
+        initial_poll_interval: Time before the second poll in seconds; the
+            gap doubles on each poll until it reaches poll_interval
+        initial_delay: Time to wait before the first poll in seconds, for
+            servers that need a moment before a new task is visible; the
+            first poll is sent immediately by default. Counts toward timeout
+        
+    Returns:
+        The final task status
+        
+    Raises:
+        TimeoutError: If the task doesn't complete within the timeout
+        Exception: If the task fails and raise_on_error is True
+        RuntimeError: If called from a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "poll_task_status_sync would block the running event loop; "
+            "use poll_task_status_async instead"
+        )
+    
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    if initial_delay > 0:
+        time.sleep(initial_delay)
+    
+    while True:
+        # Check if we've exceeded the timeout
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
+        
+        # Get task status
+        task = client.get(_TASK % task_id)
+        
+        if not task:
+            raise ValueError(f"Task {task_id} not found")
+        
+        status = task["status"]
+        
+        # Check if task is complete
+        if status in _TERMINAL:
+            if status == "failed" and raise_on_error:
+                raise Exception(f"Task {task_id} failed: {task.get('error', 'Unknown error')}")
+            return _VALIDATORS[TaskStatus].validate_python(task)
+        
+        # Wait before polling again, backing off while the task runs
+        time.sleep(_poll_delay(attempt, initial_poll_interval, poll_interval))
+        attempt += 1
+
+async def poll_task_status_async(
+    client,
+    task_id: str,
+    poll_interval: float = 1.0,
+    timeout: float = 300.0,
+    raise_on_error: bool = True,
+    initial_poll_interval: float = 0.05,
+    initial_delay: float = 0.0
+) -> TaskStatus:
+    """
+    Poll a task until it completes or times out (asynchronous version).
+    
+    Failed polls are retried with exponential backoff while they look
+    transient (connection problems, 408, 429 and 5xx), but only up to
+    _MAX_CONSECUTIVE_ERRORS in a row. Any other API error, such as 401,
+    403 or 404, is raised immediately.
+    
+    Args:
+        client: The client instance
+        task_id: ID of the task to poll
+        poll_interval: Longest time between polls in seconds
+        timeout: Maximum time to wait in seconds
+        raise_on_error: Whether to raise an exception if the task fails
+        initial_poll_interval: Time before the second poll in seconds; the
+            gap doubles on each poll until it reaches poll_interval
+        initial_delay: Time to wait before the first poll in seconds, for
+            servers that need a moment before a new task is visible; the
+            first poll is sent immediately by default. Counts toward timeout
+        
+    Returns:
+        The final task status
+        
+    Raises:
+        TimeoutError: If the task doesn't complete within the timeout
+        Exception: If the task fails and raise_on_error is True
+        APIError: On a non-transient API error, or too many failed polls
+        httpx.TransportError: If too many polls in a row fail to connect
+        RuntimeError: If the client is closed during polling
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    consecutive_errors = 0
+    if initial_delay > 0:
+        await asyncio.sleep(initial_delay)
+    
+    while True:
+        # Check if we've exceeded the timeout
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
+        
+        try:
+            # Get task status
+            task = await client.get(_TASK % task_id)
+        except (httpx.TransportError, APIError) as e:
+            if isinstance(e, APIError) and e.status_code not in _RETRYABLE_STATUS:
+                raise
+            consecutive_errors += 1
+            if consecutive_errors >= _MAX_CONSECUTIVE_ERRORS:
+                raise
+            delay = min(poll_interval * 2 ** consecutive_errors, _MAX_ERROR_DELAY)
+            await asyncio.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            continue
+        consecutive_errors = 0
+        
+        if not task:
+            raise ValueError(f"Task {task_id} not found")
+        
+        status = task["status"]
+        
+        # Check if task is complete
+        if status in _TERMINAL:
+            if status == "failed" and raise_on_error:
+                error_msg = task.get('error', 'Unknown error')
+                raise Exception(f"Task {task_id} failed: {error_msg}")
+            return _VALIDATORS[TaskStatus].validate_python(task)
+        
+        # Wait before polling again, backing off while the task runs
+        await asyncio.sleep(_poll_delay(attempt, initial_poll_interval, poll_interval))
+        attempt += 1
+
+def _parse_event(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode one line of a task event stream: an SSE ``data:`` line or a bare
+    JSON object. Blank separators, comments and other SSE fields give None.
+    """
+    if line.startswith("data:"):
+        line = line[5:]
+    elif not line.startswith("{"):
+        return None
+    return orjson.loads(line)
+
+def _final_status(task_id: str, event: Optional[Dict[str, Any]], raise_on_error: bool) -> Optional[TaskStatus]:
+    """The task's final status if event reports completion or failure, else None"""
+    if event is None or event.get("status") not in _TERMINAL:
+        return None
+    if event["status"] == "failed" and raise_on_error:
+        raise Exception(f"Task {task_id} failed: {event.get('error', 'Unknown error')}")
+    return _VALIDATORS[TaskStatus].validate_python(event)
+
+def _stream_timeout(client, read: Optional[float]) -> httpx.Timeout:
+    """Timeouts for an event stream: the client's for connecting, ``read`` between events since a task may go quiet for minutes"""
+    return httpx.Timeout(client.timeout, read=read)
+
+def poll_task_status_stream_sync(
+    client,
+    task_id: str,
+    poll_interval: float = 1.0,
+    timeout: float = 300.0,
+    raise_on_error: bool = True
+) -> TaskStatus:
+    """
+    Wait for a task through its event stream (synchronous version).
+    
+    Instead of polling, this holds one GET open on the task's events
+    endpoint and returns on the first completed or failed event. If the
+    server has no such endpoint (404), the stream ends early or it stays
+    quiet for longer than the client's timeout, it falls back to
+    poll_task_status_sync for the time that is left.
+    
+    Args:
+        client: The client instance
+        task_id: ID of the task to wait for
+        poll_interval: Longest time between polls if polling is needed
+        timeout: Maximum time to wait in seconds
+        raise_on_error: Whether to raise an exception if the task fails
+        
+    Returns:
+        The final task status
+        
+    Raises:
+        TimeoutError: If the task doesn't complete within the timeout
+        Exception: If the task fails and raise_on_error is True
+        RuntimeError: If called from a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "poll_task_status_stream_sync would block the running event loop; "
+            "use poll_task_status_stream_async instead"
+        )
+    
+    deadline = time.monotonic() + timeout
+    
+    def listen() -> Optional[TaskStatus]:
+        read = _stream_timeout(client, min(client.timeout, timeout))
+        with client._client.stream("GET", _TASK_EVENTS % task_id, timeout=read) as response:
+            if response.status_code == 404:
+                return None
+            if response.is_error:
+                response.read()
+                client._handle_response(response)
+            for line in response.iter_lines():
+                status = _final_status(task_id, _parse_event(line), raise_on_error)
+                if status is not None:
+                    return status
+                # Progress events keep the read alive, so the deadline is checked here
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
+        return None
+    
+    try:
+        status = listen()
+    except httpx.ReadTimeout:
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds") from None
+        status = None
+    if status is not None:
+        return status
+    
+    return poll_task_status_sync(
+        client,
+        task_id,
+        poll_interval=poll_interval,
+        timeout=max(0.0, deadline - time.monotonic()),
+        raise_on_error=raise_on_error
+    )
+
+async def poll_task_status_stream_async(
+    client,
+    task_id: str,
+    poll_interval: float = 1.0,
+    timeout: float = 300.0,
+    raise_on_error: bool = True
+) -> TaskStatus:
+    """
+    Wait for a task through its event stream (asynchronous version).
+    
+    Instead of polling, this holds one GET open on the task's events
+    endpoint and returns on the first completed or failed event. If the
+    server has no such endpoint (404) or the stream ends early, it falls
+    back to poll_task_status_async for the time that is left.
+    
+    Args:
+        client: The client instance
+        task_id: ID of the task to wait for
+        poll_interval: Longest time between polls if polling is needed
+        timeout: Maximum time to wait in seconds
+        raise_on_error: Whether to raise an exception if the task fails
+        
+    Returns:
+        The final task status
+        
+    Raises:
+        TimeoutError: If the task doesn't complete within the timeout
+        Exception: If the task fails and raise_on_error is True
+    """
+    deadline = time.monotonic() + timeout
+    
+    async def listen() -> Optional[TaskStatus]:
+        async with client._client.stream("GET", _TASK_EVENTS % task_id, timeout=_stream_timeout(client, None)) as response:
+            if response.status_code == 404:
+                return None
+            if response.is_error:
+                await response.aread()
+                client._handle_response(response)
+            async for line in response.aiter_lines():
+                status = _final_status(task_id, _parse_event(line), raise_on_error)
+                if status is not None:
+                    return status
+        return None
+    
+    try:
+        status = await asyncio.wait_for(listen(), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds") from None
+    if status is not None:
+        return status
+    
+    return await poll_task_status_async(
+        client,
+        task_id,
+        poll_interval=poll_interval,
+        timeout=max(0.0, deadline - time.monotonic()),
+        raise_on_error=raise_on_error
+    )
+
+def _page_params(page: int, per_page: int, search: Optional[str]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"page": page, "per_page": per_page}
+    if search:
+        params["search"] = search
+    return params
+
+def _chunks(values: List[str], size: int) -> List[List[str]]:
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+def _hybrid_request(
+    text: str,
+    k: int,
+    vector_weight: float,
+    text_weight: float,
+    min_text_score: float
+) -> Dict[str, Any]:
+    return {
+        "text": text,
+        "k": k,
+        "vector_weight": vector_weight,
+        "text_weight": text_weight,
+        "min_text_score": min_text_score
+    }
+
+def _wait_sync(client, response: Dict[str, Any], wait: bool, poll_interval: float, timeout: float, stream: bool) -> TaskStatus:
+    """Validate a task-starting response and, if asked, wait for the task to finish"""
+    task_status = _VALIDATORS[TaskStatus].validate_python(response)
+    if not wait:
+        return task_status
+    wait_for = poll_task_status_stream_sync if stream else poll_task_status_sync
+    return wait_for(client, task_status.id, poll_interval=poll_interval, timeout=timeout)
+
+async def _wait_async(client, response: Dict[str, Any], wait: bool, poll_interval: float, timeout: float, stream: bool) -> TaskStatus:
+    """Validate a task-starting response and, if asked, wait for the task to finish"""
+    task_status = _VALIDATORS[TaskStatus].validate_python(response)
+    if not wait:
+        return task_status
+    wait_for = poll_task_status_stream_async if stream else poll_task_status_async
+    return await wait_for(client, task_status.id, poll_interval=poll_interval, timeout=timeout)
+
+class _Helpers:
+    """Base for helper groups: a slotted holder for the client their methods call"""
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getitem__(self, name: str):
+        # The factories used to return dicts of functions; keep helpers["name"] working
+        return getattr(self, name)
+
+class LegacyIndexHelpersSync(_Helpers):
+    """Synchronous helper functions for index operations on the legacy endpoints"""
+    __slots__ = ()
+
+    def list_indexes(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        *,
+        validate: bool = False
+    ) -> Union[IndexListResponseDict, IndexListResponse]:
+        """List all indexes with pagination and optional search; validate=True returns an IndexListResponse"""
+        response = self._client.get("/index/list", params=_page_params(page, per_page, search))
+        if validate:
+            return _VALIDATORS[IndexListResponse].validate_python(response)
+        return response
+
+    def get_index_info(self, index_id: str) -> Dict[str, Any]:
+        """Get information about a specific index"""
+        return self._client.get(_INDEX_INFO % index_id)
+
+    def query_index(self, index_id: str, text: str, k: int = 10) -> Dict[str, Any]:
+        """Query an index with text"""
+        return self._client.post(_INDEX_QUERY % index_id, json={"text": text, "k": k})
+
+    def hybrid_search(
+        self,
+        index_id: str,
+        text: str,
+        k: int = 10,
+        vector_weight: float = 0.5,
+        text_weight: float = 0.5,
+        min_text_score: float = 0.0
+    ) -> Dict[str, Any]:
+        """Perform hybrid search on an index"""
+        request = _hybrid_request(text, k, vector_weight, text_weight, min_text_score)
+        return self._client.post(_INDEX_HYBRID % index_id, json=request)
+
+    def update_metadata(self, index_id: str, primary_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Update metadata for an entry in an index"""
+        return self._client.post(_INDEX_UPDATE % index_id, json={"primary_id": primary_id, "metadata": metadata})
+
+    def list_index_entries(
+        self,
+        index_id: str,
+        page: int = 1,
+        per_page: int = 10,
+        include_deleted: bool = False
+    ) -> Dict[str, Any]:
+        """List entries in an index with pagination"""
+        params = {"page": page, "per_page": per_page, "include_deleted": include_deleted}
+        return self._client.get(_INDEX_ENTRIES % index_id, params=params)
+
+    def delete_index_complete(
+        self,
+        index_id: str,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Delete an index completely, including all its data and metadata"""
+        response = self._client.post(_INDEX_DELETE_COMPLETE % index_id)
+        return _wait_sync(self._client, response, wait, poll_interval, timeout, stream)
+    
+    def delete_index_entries(
+        self,
+        index_id: str,
+        entry_ids: List[str],
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Delete entries from an index in one request; use delete_index_entries_chunked for very large deletes"""
+        response = self._client.post(_INDEX_DELETE % index_id, json={"ids": entry_ids})
+        return _wait_sync(self._client, response, wait, poll_interval, timeout, stream)
+    
+    def delete_index_entries_batch(
+        self,
+        index_id: str,
+        id_lists: List[List[str]],
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> List[TaskStatus]:
+        """
+        Delete several lists of entries from an index, one task per list.
+        
+        The lists are deleted (and waited on) concurrently from a small
+        thread pool. Statuses are returned in the order of id_lists.
+        """
+        def delete(ids: List[str]) -> TaskStatus:
+            return self.delete_index_entries(index_id, ids, wait, poll_interval, timeout, stream)
+        
+        if len(id_lists) == 1:
+            return [delete(id_lists[0])]
+        with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as pool:
+            return list(pool.map(delete, id_lists))
+
+    def delete_index_entries_chunked(
+        self,
+        index_id: str,
+        entry_ids: List[str],
+        batch_size: int = _DELETE_BATCH_SIZE,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> List[TaskStatus]:
+        """Delete entries from an index in requests of at most batch_size ids, one task per request"""
+        return self.delete_index_entries_batch(
+            index_id, _chunks(entry_ids, batch_size), wait, poll_interval, timeout, stream
+        )
+
+class LegacyDocumentHelpersSync(_Helpers):
+    """Synchronous helper functions for document operations on the legacy endpoints"""
+    __slots__ = ()
+
+    def list_documents(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        *,
+        validate: bool = False
+    ) -> Union[DocumentListResponseDict, DocumentListResponse]:
+        """List all documents with pagination and optional search; validate=True returns a DocumentListResponse"""
+        response = self._client.get("/document/list", params=_page_params(page, per_page, search))
+        if validate:
+            return _VALIDATORS[DocumentListResponse].validate_python(response)
+        return response
+
+    def get_document_info(self, doc_id: str) -> Dict[str, Any]:
+        """Get information about a specific document"""
+        return self._client.get(_DOC_INFO % doc_id)
+
+    def query_document(self, doc_id: str, query: str, k: int = 10) -> Dict[str, Any]:
+        """Query a document"""
+        return self._client.post(_DOC_QUERY % doc_id, json={"query": query, "k": k})
+
+    def research_document(
+        self,
+        doc_id: str,
+        query: str,
+        k: int = 10,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Research a document"""
+        response = self._client.post(_DOC_RESEARCH % doc_id, json={"query": query, "k": k})
+        return _wait_sync(self._client, response, wait, poll_interval, timeout, stream)
+
+    def query_research(self, doc_id: str, research_id: str, query: str, k: int = 10) -> Dict[str, Any]:
+        """Query a specific research within a document"""
+        return self._client.post(_DOC_RESEARCH_QUERY % (doc_id, research_id), json={"query": query, "k": k})
+
+    def delete_document(
+        self,
+        doc_id: str,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Delete a document"""
+        response = self._client.post(_DOC_DELETE % doc_id)
+        return _wait_sync(self._client, response, wait, poll_interval, timeout, stream)
+
+    def index_document(
+        self,
+        doc_id: str,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Index a document"""
+        response = self._client.post(_DOC_INDEX % doc_id)
+        return _wait_sync(self._client, response, wait, poll_interval, timeout, stream)
+
+class LegacyTaskHelpersSync(_Helpers):
+    """Synchronous helper functions for task operations on the legacy endpoints"""
+    __slots__ = ()
+
+    def list_tasks(self, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
+        """List all tasks with pagination"""
+        return self._client.get("/task/list", params={"page": page, "per_page": per_page})
+    
+    def get_task_status(
+        self,
+        task_id: str,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0
+    ) -> TaskStatus:
+        """Get the status of a task, optionally waiting for completion"""
+        return poll_task_status_sync(
+            self._client,
+            task_id,
+            poll_interval=poll_interval,
+            timeout=timeout
+        )
+
+class LegacyIndexHelpersAsync(_Helpers):
+    """Asynchronous helper functions for index operations on the legacy endpoints"""
+    __slots__ = ()
+
+    async def list_indexes(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        *,
+        validate: bool = False
+    ) -> Union[IndexListResponseDict, IndexListResponse]:
+        """List all indexes with pagination and optional search; validate=True returns an IndexListResponse"""
+        response = await self._client.get("/index/list", params=_page_params(page, per_page, search))
+        if validate:
+            return _VALIDATORS[IndexListResponse].validate_python(response)
+        return response
+
+    async def get_index_info(self, index_id: str) -> Dict[str, Any]:
+        """Get information about a specific index"""
+        return await self._client.get(_INDEX_INFO % index_id)
+
+    async def query_index(self, index_id: str, text: str, k: int = 10) -> Dict[str, Any]:
+        """Query an index with text"""
+        return await self._client.post(_INDEX_QUERY % index_id, json={"text": text, "k": k})
+
+    async def hybrid_search(
+        self,
+        index_id: str,
+        text: str,
+        k: int = 10,
+        vector_weight: float = 0.5,
+        text_weight: float = 0.5,
+        min_text_score: float = 0.0
+    ) -> Dict[str, Any]:
+        """Perform hybrid search on an index"""
+        request = _hybrid_request(text, k, vector_weight, text_weight, min_text_score)
+        return await self._client.post(_INDEX_HYBRID % index_id, json=request)
+
+    async def update_metadata(self, index_id: str, primary_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Update metadata for an entry in an index"""
+        return await self._client.post(_INDEX_UPDATE % index_id, json={"primary_id": primary_id, "metadata": metadata})
+
+    async def list_index_entries(
+        self,
+        index_id: str,
+        page: int = 1,
+        per_page: int = 10,
+        include_deleted: bool = False
+    ) -> Dict[str, Any]:
+        """List entries in an index with pagination"""
+        params = {"page": page, "per_page": per_page, "include_deleted": include_deleted}
+        return await self._client.get(_INDEX_ENTRIES % index_id, params=params)
+
+    async def delete_index_complete(
+        self,
+        index_id: str,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Delete an index completely, including all its data and metadata"""
+        response = await self._client.post(_INDEX_DELETE_COMPLETE % index_id)
+        return await _wait_async(self._client, response, wait, poll_interval, timeout, stream)
+    
+    async def delete_index_entries(
+        self,
+        index_id: str,
+        entry_ids: List[str],
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Delete entries from an index in one request; use delete_index_entries_chunked for very large deletes"""
+        response = await self._client.post(_INDEX_DELETE % index_id, json={"ids": entry_ids})
+        return await _wait_async(self._client, response, wait, poll_interval, timeout, stream)
+    
+    async def delete_index_entries_batch(
+        self,
+        index_id: str,
+        id_lists: List[List[str]],
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> List[TaskStatus]:
+        """
+        Delete several lists of entries from an index, one task per list.
+        
+        Every list is posted at once and each task is polled as soon as its
+        own POST returns, so waiting on early tasks overlaps with posting
+        later ones. Statuses are returned in the order of id_lists.
+        """
+        return list(await asyncio.gather(*(
+            self.delete_index_entries(index_id, ids, wait, poll_interval, timeout, stream)
+            for ids in id_lists
+        )))
+
+    async def delete_index_entries_chunked(
+        self,
+        index_id: str,
+        entry_ids: List[str],
+        batch_size: int = _DELETE_BATCH_SIZE,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> List[TaskStatus]:
+        """Delete entries from an index in requests of at most batch_size ids, one task per request"""
+        return await self.delete_index_entries_batch(
+            index_id, _chunks(entry_ids, batch_size), wait, poll_interval, timeout, stream
+        )
+
+class LegacyDocumentHelpersAsync(_Helpers):
+    """Asynchronous helper functions for document operations on the legacy endpoints"""
+    __slots__ = ()
+
+    async def list_documents(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        *,
+        validate: bool = False
+    ) -> Union[DocumentListResponseDict, DocumentListResponse]:
+        """List all documents with pagination and optional search; validate=True returns a DocumentListResponse"""
+        response = await self._client.get("/document/list", params=_page_params(page, per_page, search))
+        if validate:
+            return _VALIDATORS[DocumentListResponse].validate_python(response)
+        return response
+
+    async def get_document_info(self, doc_id: str) -> Dict[str, Any]:
+        """Get information about a specific document"""
+        return await self._client.get(_DOC_INFO % doc_id)
+
+    async def query_document(self, doc_id: str, query: str, k: int = 10) -> Dict[str, Any]:
+        """Query a document"""
+        return await self._client.post(_DOC_QUERY % doc_id, json={"query": query, "k": k})
+
+    async def research_document(
+        self,
+        doc_id: str,
+        query: str,
+        k: int = 10,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Research a document"""
+        response = await self._client.post(_DOC_RESEARCH % doc_id, json={"query": query, "k": k})
+        return await _wait_async(self._client, response, wait, poll_interval, timeout, stream)
+
+    async def query_research(self, doc_id: str, research_id: str, query: str, k: int = 10) -> Dict[str, Any]:
+        """Query a specific research within a document"""
+        return await self._client.post(_DOC_RESEARCH_QUERY % (doc_id, research_id), json={"query": query, "k": k})
+
+    async def delete_document(
+        self,
+        doc_id: str,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Delete a document"""
+        response = await self._client.post(_DOC_DELETE % doc_id)
+        return await _wait_async(self._client, response, wait, poll_interval, timeout, stream)
+
+    async def index_document(
+        self,
+        doc_id: str,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        stream: bool = False
+    ) -> TaskStatus:
+        """Index a document"""
+        response = await self._client.post(_DOC_INDEX % doc_id)
+        return await _wait_async(self._client, response, wait, poll_interval, timeout, stream)
+
+class LegacyTaskHelpersAsync(_Helpers):
+    """Asynchronous helper functions for task operations on the legacy endpoints"""
+    __slots__ = ()
+
+    async def list_tasks(self, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
+        """List all tasks with pagination"""
+        return await self._client.get("/task/list", params={"page": page, "per_page": per_page})
+    
+    async def get_task_status(
+        self,
+        task_id: str,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0
+    ) -> TaskStatus:
+        """Get the status of a task, optionally waiting for completion"""
+        return await poll_task_status_async(
+            self._client,
+            task_id,
+            poll_interval=poll_interval,
+            timeout=timeout
+        )
+
+def create_index_helpers_sync(client) -> LegacyIndexHelpersSync:
+    """Create synchronous helper functions for index operations"""
+    return LegacyIndexHelpersSync(client)
+
+def create_document_helpers_sync(client) -> LegacyDocumentHelpersSync:
+    """Create synchronous helper functions for document operations"""
+    return LegacyDocumentHelpersSync(client)
+
+def create_task_helpers_sync(client) -> LegacyTaskHelpersSync:
+    """Create synchronous helper functions for task operations"""
+    return LegacyTaskHelpersSync(client)
+
+async def create_index_helpers_async(client) -> LegacyIndexHelpersAsync:
+    """Create asynchronous helper functions for index operations"""
+    return LegacyIndexHelpersAsync(client)
+
+async def create_document_helpers_async(client) -> LegacyDocumentHelpersAsync:
+    """Create asynchronous helper functions for document operations"""
+    return LegacyDocumentHelpersAsync(client)
+
+async def create_task_helpers_async(client) -> LegacyTaskHelpersAsync:
+    """Create asynchronous helper functions for task operations"""
+    return LegacyTaskHelpersAsync(client)
+
+# Async versions (renamed from original functions)
+create_index_helpers = create_index_helpers_async
+create_document_helpers = create_document_helpers_async
+create_task_helpers = create_task_helpers_async
+poll_task_status = poll_task_status_async 
\ No newline at end of file
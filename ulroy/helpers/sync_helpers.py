@@ -1,93 +1,273 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union, Sequence, Iterator
 from pydantic import BaseModel
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+import random
 import time
 from datetime import datetime, timedelta
-from ulroy.exceptions import APIError
-from .async_helpers import (
+from ulroy.exceptions import APIError, BulkOperationError
+from ._models import (
     IndexInfo, DocumentInfo, QueryRequest, DocumentQuery,
     HybridSearchRequest, UpdateMetadataRequest, PaginatedResponse,
-    IndexListResponse, DocumentListResponse, TaskStatus
+    IndexListResponse, DocumentListResponse, TaskStatus,
+    IndexListResponseDict, _VALIDATORS,
+    _EMPTY, _TERMINAL, _remaining_pages, _merge_pages
 )
 
-def create_index_helpers(client):
-    """Create sync index helper functions"""
-    def create(index_config: Dict[str, Any]) -> Dict[str, Any]:
+# Positional endpoint templates, filled with str.format at call time
+_EP_INDEXES = "/indexes"
+_EP_INDEX = "/indexes/{}"
+_EP_DOCS = "/indexes/{}/documents"
+_EP_DOC = "/indexes/{}/documents/{}"
+_EP_SEARCH = "/indexes/{}/search"
+_EP_DOCS_BATCH = "/indexes/{}/documents/batch"
+_EP_DOCS_BATCH_DELETE = "/indexes/{}/documents/batch-delete"
+_EP_MULTI_SEARCH = "/indexes/{}/multi_search"
+_EP_TASK = "/tasks/{}"
+
+# Longest pause between task checks when the server answers without waiting
+_POLL_BACKOFF_CAP = 10.0
+
+# Items sent per request by the bulk document helpers
+_BULK_CHUNK_SIZE = 500
+
+# Searches search_many keeps in flight at once
+_SEARCH_CONCURRENCY = 16
+
+def _post_in_chunks(client, endpoint: str, key: str, values: List[Any], chunk_size: int) -> List[Dict[str, Any]]:
+    """
+    POST ``values`` under ``key`` in slices of ``chunk_size`` and collect the
+    per-item results, raising BulkOperationError if any item failed.
+    """
+    items: List[Dict[str, Any]] = []
+    for start in range(0, len(values), chunk_size):
+        response = client.post(endpoint, json={key: values[start:start + chunk_size]})
+        items.extend(response.get("items", _EMPTY))
+    failed = [item for item in items if item.get("error")]
+    if failed:
+        raise BulkOperationError(failed, items)
+    return items
+
+def _list_all_pages(list_page, key: str, per_page: int, search: Optional[str], max_workers: int) -> Dict[str, Any]:
+    """
+    Fetch the first page with ``list_page``, then the remaining pages from a
+    thread pool sharing the client's connections, and merge the ``key`` items
+    of all pages into a single listing
+    """
+    first = list_page(1, per_page, search)
+    per_page, rest = _remaining_pages(first, per_page)
+    if not rest:
+        return _merge_pages(first, key, _EMPTY)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(rest))) as pool:
+        return _merge_pages(first, key, pool.map(lambda page: list_page(page, per_page, search), rest))
+
+class IndexHelpersSync:
+    """Sync index helpers bound to a client"""
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
+
+    def create(self, index_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new index"""
-        return client.post("/indexes", json=index_config)
+        return self._client.post(_EP_INDEXES, json=index_config)
 
-    def list(page: int = 1, per_page: int = 10, search: Optional[str] = None) -> IndexListResponse:
-        """List all indexes"""
+    def list_indexes(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        validate: bool = False
+    ) -> Union[IndexListResponseDict, IndexListResponse]:
+        """List all indexes; pass validate=True to get an IndexListResponse instead of the raw dict"""
         params = {"page": page, "per_page": per_page}
         if search:
             params["search"] = search
-        response = client.get("/indexes", params=params)
-        return IndexListResponse(**response)
+        response = self._client.get(_EP_INDEXES, params=params)
+        if validate:
+            return _VALIDATORS[IndexListResponse].validate_python(response)
+        return response
+
+    list = list_indexes
 
-    def get(index_id: str) -> Dict[str, Any]:
+    def list_all(
+        self,
+        per_page: int = 100,
+        search: Optional[str] = None,
+        max_workers: int = 16
+    ) -> IndexListResponseDict:
+        """List every index, fetching the pages after the first concurrently"""
+        return _list_all_pages(self.list_indexes, "indexes", per_page, search, max_workers)
+
+    def get(self, index_id: str) -> Dict[str, Any]:
         """Get index details"""
-        return client.get(f"/indexes/{index_id}")
+        return self._client.get(_EP_INDEX.format(index_id))
 
-    def delete(index_id: str) -> Dict[str, Any]:
+    def delete(self, index_id: str) -> Dict[str, Any]:
         """Delete an index"""
-        return client.delete(f"/indexes/{index_id}")
-
-    return type("IndexHelpers", (), {
-        "create": create,
-        "list": list,
-        "get": get,
-        "delete": delete
-    })()
-
-def create_document_helpers(client):
-    """Create sync document helper functions"""
-    def add(index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
+        return self._client.delete(_EP_INDEX.format(index_id))
+
+class DocumentHelpersSync:
+    """Sync document helpers bound to a client"""
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
+
+    def add(self, index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
         """Add a document to an index"""
-        return client.post(f"/indexes/{index_id}/documents", json=document)
+        return self._client.post(_EP_DOCS.format(index_id), json=document)
 
-    def get(index_id: str, doc_id: str) -> Dict[str, Any]:
+    def get(self, index_id: str, doc_id: str) -> Dict[str, Any]:
         """Get a document from an index"""
-        return client.get(f"/indexes/{index_id}/documents/{doc_id}")
+        return self._client.get(_EP_DOC.format(index_id, doc_id))
 
-    def update(index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, index_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
         """Update a document in an index"""
-        return client.put(f"/indexes/{index_id}/documents/{document['id']}", json=document)
+        return self._client.put(_EP_DOC.format(index_id, document["id"]), json=document)
 
-    def delete(index_id: str, doc_id: str) -> Dict[str, Any]:
+    def delete(self, index_id: str, doc_id: str) -> Dict[str, Any]:
         """Delete a document from an index"""
-        return client.delete(f"/indexes/{index_id}/documents/{doc_id}")
-
-    def search(index_id: str, query: str, k: int = 10) -> List[Dict[str, Any]]:
-        """Search documents in an index"""
-        response = client.post(f"/indexes/{index_id}/search", json={"query": query, "k": k})
-        return response.get("results", [])
-
-    return type("DocumentHelpers", (), {
-        "add": add,
-        "get": get,
-        "update": update,
-        "delete": delete,
-        "search": search
-    })()
-
-def create_task_helpers(client):
-    """Create sync task helper functions"""
-    def get_status(task_id: str) -> TaskStatus:
+        return self._client.delete(_EP_DOC.format(index_id, doc_id))
+
+    def search(self, index_id: str, query: str, k: int = 10) -> Sequence[Dict[str, Any]]:
+        """Search documents in an index; an empty tuple if the response has no results"""
+        response = self._client.post(_EP_SEARCH.format(index_id), json={"query": query, "k": k})
+        return response.get("results", _EMPTY)
+
+    def search_many(
+        self,
+        index_id: str,
+        queries: List[str],
+        k: int = 10,
+        concurrency: int = _SEARCH_CONCURRENCY
+    ) -> List[Sequence[Dict[str, Any]]]:
+        """
+        Run several searches concurrently, one request each; returns one result
+        list per query, in order. Over HTTP/2 the requests share a connection
+        as parallel streams. Prefer multi_search where the server supports it.
+        """
+        if not queries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(queries))) as pool:
+            return list(pool.map(lambda query: self.search(index_id, query, k), queries))
+
+    def search_iter(self, index_id: str, query: str, k: int = 10) -> Iterator[Dict[str, Any]]:
+        """
+        Search documents in an index, yielding results one at a time.
+
+        Rows are decoded lazily from the raw body, so a caller that stops early
+        or filters a large ``k`` never builds the full result list. Requires
+        ijson (``pip install ulroy[stream]``).
+        """
+        try:
+            import ijson
+        except ImportError as e:
+            raise ImportError(
+                "Streaming responses require ijson; install it with `pip install ulroy[stream]`"
+            ) from e
+        raw = self._client.post_raw(_EP_SEARCH.format(index_id), json={"query": query, "k": k})
+        return ijson.items(BytesIO(raw), "results.item", use_float=True)
+
+    def add_many(
+        self,
+        index_id: str,
+        documents: List[Dict[str, Any]],
+        chunk_size: int = _BULK_CHUNK_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Add documents through the batch endpoint, ``chunk_size`` per request.
+        Returns the per-item results; raises BulkOperationError if any failed.
+        """
+        endpoint = _EP_DOCS_BATCH.format(index_id)
+        return _post_in_chunks(self._client, endpoint, "documents", documents, chunk_size)
+
+    def delete_many(
+        self,
+        index_id: str,
+        doc_ids: List[str],
+        chunk_size: int = _BULK_CHUNK_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete documents through the batch endpoint, ``chunk_size`` per request.
+        Returns the per-item results; raises BulkOperationError if any failed.
+        """
+        endpoint = _EP_DOCS_BATCH_DELETE.format(index_id)
+        return _post_in_chunks(self._client, endpoint, "ids", doc_ids, chunk_size)
+
+    def multi_search(self, index_id: str, queries: List[str], k: int = 10) -> Sequence[List[Dict[str, Any]]]:
+        """Run several searches in one request; returns one result list per query"""
+        response = self._client.post(
+            _EP_MULTI_SEARCH.format(index_id),
+            json={"queries": [{"query": query, "k": k} for query in queries]},
+        )
+        return response.get("results", _EMPTY)
+
+class TaskHelpersSync:
+    """Sync task helpers bound to a client"""
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
+
+    def get_status(self, task_id: str) -> TaskStatus:
         """Get task status"""
-        response = client.get(f"/tasks/{task_id}")
-        return TaskStatus(**response)
+        response = self._client.get(_EP_TASK.format(task_id))
+        return _VALIDATORS[TaskStatus].validate_python(response)
 
-    def wait_for_completion(task_id: str, poll_interval: float = 1.0, timeout: float = 300.0) -> TaskStatus:
-        """Wait for a task to complete"""
-        start_time = time.time()
+    def get_status_long_poll(self, task_id: str, wait: float = 30.0) -> TaskStatus:
+        """
+        Get task status, letting the server hold the request for up to
+        ``wait`` whole seconds until the task changes state. Servers without
+        long polling answer straight away, like get_status.
+        """
+        seconds = int(wait)
+        response = self._client.get(
+            _EP_TASK.format(task_id),
+            params={"wait": seconds},
+            headers={"Prefer": f"wait={seconds}"},
+            timeout=seconds + self._client.timeout,
+        )
+        return _VALIDATORS[TaskStatus].validate_python(response)
+
+    def wait_for_completion(
+        self,
+        task_id: str,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        initial_delay: float = 0.0,
+        long_poll: float = 30.0
+    ) -> TaskStatus:
+        """Wait for a task to complete, long-polling up to long_poll seconds per check"""
+        # Monotonic, so wall-clock adjustments can't stretch or cut the timeout
+        deadline = time.monotonic() + timeout
+        if initial_delay > 0:
+            time.sleep(initial_delay)
+        attempt = 0
         while True:
-            status = get_status(task_id)
-            if status.status in ["completed", "failed"]:
-                return status
-            if time.time() - start_time > timeout:
+            # Check before fetching so we don't spend a request after the deadline
+            sent_at = time.monotonic()
+            remaining = deadline - sent_at
+            if remaining <= 0:
                 raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
-            time.sleep(poll_interval)
+            status = self.get_status_long_poll(task_id, wait=min(long_poll, remaining))
+            if status.status in _TERMINAL:
+                return status
+            # A request the server held already spaced the checks out
+            now = time.monotonic()
+            if now - sent_at < poll_interval:
+                ceiling = max(poll_interval, min(_POLL_BACKOFF_CAP, poll_interval * 2 ** attempt))
+                time.sleep(max(0.0, min(random.uniform(poll_interval, ceiling), deadline - now)))
+                attempt += 1
+
+def create_index_helpers(client) -> IndexHelpersSync:
+    """Create sync index helpers"""
+    return IndexHelpersSync(client)
+
+def create_document_helpers(client) -> DocumentHelpersSync:
+    """Create sync document helpers"""
+    return DocumentHelpersSync(client)
 
-    return type("TaskHelpers", (), {
-        "get_status": get_status,
-        "wait_for_completion": wait_for_completion
-    })() 
\ No newline at end of file
+def create_task_helpers(client) -> TaskHelpersSync:
+    """Create sync task helpers"""
+    return TaskHelpersSync(client)
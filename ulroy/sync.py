@@ -1,6 +1,8 @@
 from typing import Optional, Dict, Any, Union
+import time
 import httpx
-from .base import BaseClient, APIError
+import orjson
+from .base import BaseClient, _json_dumps, _cache_key, _ETagCache
 from .helpers import (
     create_index_helpers_sync,
     create_document_helpers_sync,
@@ -10,19 +12,34 @@ from .helpers import (
 class UlroyClient(BaseClient):
     """Synchronous client for the Ulroy API."""
     
+    __slots__ = ("_client", "_etags", "index", "document", "task")
+    
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://www.ulroy.com/api/v1",
         timeout: float = 30.0,
         max_retries: int = 3,
+        http2: bool = True,
+        pool_size: int = 64,
+        keepalive_expiry: float = 30.0,
+        etag_cache_size: int = 0,
     ):
+        """Initialize the sync client; a positive etag_cache_size revalidates GETs by ETag."""
         super().__init__(api_key, base_url, timeout, max_retries)
+        self._client: Optional[httpx.Client] = None
         self._client = httpx.Client(
-            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=min(pool_size, 50),
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
             headers=self._headers,
             base_url=self.base_url,
         )
+        self._etags = _ETagCache(etag_cache_size) if etag_cache_size > 0 else None
         
         # Initialize helper functions
         self.index = create_index_helpers_sync(self)
@@ -36,8 +53,8 @@ class UlroyClient(BaseClient):
         self.close()
 
     def close(self):
-        """Close the HTTP client."""
-        if hasattr(self, '_client') and self._client is not None:
+        """Close the HTTP client and the connections in its pool."""
+        if self._client is not None:
             self._client.close()
             self._client = None
 
@@ -48,46 +65,85 @@ class UlroyClient(BaseClient):
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
-        """Make an HTTP request with retry logic."""
-        if not hasattr(self, '_client') or self._client is None:
+        idempotent: bool = False,
+        timeout: Optional[float] = None,
+        raw: bool = False,
+        etag_key: Optional[tuple] = None,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Make an HTTP request with retry logic; with raw the undecoded body is returned."""
+        if self._client is None:
             raise RuntimeError("Client is closed")
             
-        url = self._build_url(endpoint)
-        headers = self._get_headers(headers)
+        cached = self._etags.get(etag_key) if etag_key is not None else None
+        if cached is not None:
+            headers = {**(headers or {}), "If-None-Match": cached[0]}
+        # Serialize once with orjson rather than letting httpx run stdlib json
+        # on every attempt; the default headers already declare application/json
+        content = _json_dumps(json) if json is not None else None
         
         for attempt in range(self.max_retries):
             try:
                 response = self._client.request(
                     method=method,
-                    url=url,
+                    # Relative endpoints are joined onto base_url by httpx itself
+                    url=endpoint,
                     params=params,
-                    json=json,
+                    content=content,
+                    # self._headers are already client defaults; only send extras
                     headers=headers,
+                    timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
                 )
-                return self._handle_response(response)
-            except (httpx.RequestError, APIError) as e:
-                if attempt == self.max_retries - 1:
+                if response.status_code == 304 and cached is not None:
+                    return orjson.loads(cached[1])
+                if attempt < self.max_retries - 1:
+                    self._raise_if_retrying(response, method, idempotent)
+                if raw and response.status_code < 400:
+                    return response.content
+                data = self._handle_response(response)
+                etag = response.headers.get("ETag")
+                if etag_key is not None and etag:
+                    self._etags.set(etag_key, etag, response.content)
+                return data
+            except self._RETRYABLE as e:
+                if attempt == self.max_retries - 1 or not self._is_retryable(e, method, idempotent):
                     raise
-                continue
+                time.sleep(self._retry_delay(attempt, e))
 
     def get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Make a GET request."""
-        return self._request("GET", endpoint, params=params, headers=headers)
+        """Make a GET request, revalidating a cached response by ETag when there is one."""
+        etag_key = None
+        if self._etags is not None:
+            etag_key = _cache_key(endpoint, params)
+            if etag_key is not None:
+                # Extra headers (e.g. Accept-Language) can change the representation
+                etag_key += (tuple(sorted((headers or {}).items())),)
+        return self._request("GET", endpoint, params=params, headers=headers, timeout=timeout, etag_key=etag_key)
 
     def post(
         self,
         endpoint: str,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: bool = False,
     ) -> Dict[str, Any]:
-        """Make a POST request."""
-        return self._request("POST", endpoint, json=json, headers=headers)
+        """Make a POST request. Set ``idempotent`` to allow retrying on server errors."""
+        return self._request("POST", endpoint, json=json, headers=headers, idempotent=idempotent)
+
+    def post_raw(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: bool = False,
+    ) -> bytes:
+        """Make a POST request and return the undecoded response body."""
+        return self._request("POST", endpoint, json=json, headers=headers, idempotent=idempotent, raw=True)
 
     def put(
         self,